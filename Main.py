@@ -13,9 +13,14 @@
 
 import sys
 import os
-import time
+import math
+import json
+import hashlib
 import random
 import threading
+from array import array
+from collections import OrderedDict
+from itertools import cycle, groupby
 from dotenv import load_dotenv
 
 # --- PySide6 Imports ---
@@ -33,6 +38,87 @@ import google.generativeai as genai
 # --- Initial Configuration ---
 load_dotenv()
 AVG_CHARS_PER_WORD = 5
+GEMINI_MODEL = 'gemini-2.0-flash'
+BATCH_MAX_CHAR_DELAY = 0.05  # Above this, per-key timing is user-perceptible
+
+NATIVE_BATCH_MAX_CHAR_DELAY = 0.02  # Below this, batches go straight to SendInput on Windows
+
+# Token kinds produced by TypingEngine._tokenize (decide the pause after each token)
+TOKEN_WORD, TOKEN_NEWLINE, TOKEN_SENTENCE_END = range(3)
+
+# =============================================================================
+# NATIVE KEYBOARD INPUT (Windows)
+# =============================================================================
+# pynput's type() sends one SendInput call per key event; for fast batches we
+# build the whole INPUT[] array ourselves and hand it to the OS in one call.
+if sys.platform == "win32":
+    import ctypes
+    from bisect import bisect_right
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    KEYEVENTF_UNICODE = 0x0004
+    VK_RETURN = 0x0D
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class HARDWAREINPUT(ctypes.Structure):
+        _fields_ = [("uMsg", wintypes.DWORD), ("wParamL", wintypes.WORD), ("wParamH", wintypes.WORD)]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+    _user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _user32.SendInput.restype = wintypes.UINT
+
+    def _send_key_events(events):
+        inputs = (INPUT * len(events))()
+        for item, (vk, scan, flags) in zip(inputs, events):
+            item.type = INPUT_KEYBOARD
+            item.union.ki = KEYBDINPUT(vk, scan, flags, 0, 0)
+        return _user32.SendInput(len(events), inputs, ctypes.sizeof(INPUT))
+
+    def send_input_batch(text):
+        """Sends a key down/up pair per character in a single SendInput call.
+        Returns how many leading characters were typed; the caller sends the rest."""
+        events = []
+        ends = []  # Event count after each character, to map a partial send back to characters
+        for char in text:
+            if char == '\n':
+                events.append((VK_RETURN, 0, 0))
+                events.append((VK_RETURN, 0, KEYEVENTF_KEYUP))
+                ends.append(len(events))
+                continue
+            # Characters outside the BMP are sent as two UTF-16 surrogate units
+            data = char.encode('utf-16-le')
+            for j in range(0, len(data), 2):
+                unit = int.from_bytes(data[j:j + 2], 'little')
+                events.append((0, unit, KEYEVENTF_UNICODE))
+                events.append((0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+            ends.append(len(events))
+
+        sent = _send_key_events(events)
+        if sent == len(events):
+            return len(text)
+        done = bisect_right(ends, sent)
+        if sent > (ends[done - 1] if done else 0):
+            # Cut mid-character: its key-down already typed it, so finish its events to release the key
+            _send_key_events(events[sent:ends[done]])
+            done += 1
+        return done
+else:
+    send_input_batch = None
 
 # =============================================================================
 # STYLING (QSS - Qt Style Sheets)
@@ -75,6 +161,75 @@ PROFILES = {
     "Custom": None  # Placeholder
 }
 
+# Keyboard neighbours used to simulate adjacency typos
+_ADJ_MAP = {'q': 'w', 'w': 'es', 'e': 'wr', 'r': 'et', 't': 'ry', 'y': 'tu', 'u': 'yi', 'i': 'uo', 'o': 'ip',
+            'p': 'o[', 'a': 's', 's': 'adw', 'd': 'efs', 'f': 'dgr', 'g': 'fht', 'h': 'gjy', 'j': 'hku',
+            'k': 'jli', 'l': 'k;o', ';': 'l', 'z': 'x', 'x': 'zc', 'c': 'xvd', 'v': 'cfb', 'b': 'vgn',
+            'n': 'bhm', 'm': 'njk'}
+_ADJ_KEYS = frozenset(_ADJ_MAP)
+_INSERTION_CHARS = tuple('aeiou')
+_MISTAKE_TYPES = ('adjacency', 'transposition', 'omission', 'insertion')
+
+
+# =============================================================================
+# PARAPHRASE CACHE
+# =============================================================================
+# In-memory LRU keyed by (model, sha1 of source text, intensity). Writing it to disk is
+# opt-in (GHOSTTYPER_PARAPHRASE_CACHE=1) since entries hold the user's rewritten text.
+PARAPHRASE_CACHE_SIZE = 32
+PARAPHRASE_CACHE_PERSIST = os.getenv("GHOSTTYPER_PARAPHRASE_CACHE") == "1"
+PARAPHRASE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".ghosttyper", "paraphrase_cache.jsonl")
+_PARAPHRASE_CACHE: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+_paraphrase_cache_loaded = False
+
+
+def _paraphrase_cache_key(text, intensity):
+    return GEMINI_MODEL, hashlib.sha1(text.encode("utf-8")).hexdigest(), intensity
+
+
+def _load_paraphrase_cache():
+    global _paraphrase_cache_loaded
+    if _paraphrase_cache_loaded or not PARAPHRASE_CACHE_PERSIST: return
+    _paraphrase_cache_loaded = True
+    try:
+        with open(PARAPHRASE_CACHE_FILE, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    key = (entry['model'], entry['hash'], entry['intensity'])
+                    _PARAPHRASE_CACHE[key] = entry['text']
+                except (ValueError, KeyError, TypeError):
+                    continue  # Skip corrupt or outdated lines
+    except OSError:
+        return  # No cache yet
+    while len(_PARAPHRASE_CACHE) > PARAPHRASE_CACHE_SIZE:
+        _PARAPHRASE_CACHE.popitem(last=False)
+
+
+def _get_cached_paraphrase(key):
+    _load_paraphrase_cache()
+    text = _PARAPHRASE_CACHE.get(key)
+    if text is not None:
+        _PARAPHRASE_CACHE.move_to_end(key)
+    return text
+
+
+def _store_paraphrase(key, text):
+    _PARAPHRASE_CACHE[key] = text
+    _PARAPHRASE_CACHE.move_to_end(key)
+    while len(_PARAPHRASE_CACHE) > PARAPHRASE_CACHE_SIZE:
+        _PARAPHRASE_CACHE.popitem(last=False)
+    if not PARAPHRASE_CACHE_PERSIST: return
+    try:
+        # Rewrite the whole (bounded) cache so the file never outgrows it
+        os.makedirs(os.path.dirname(PARAPHRASE_CACHE_FILE), exist_ok=True)
+        with open(PARAPHRASE_CACHE_FILE, "w", encoding="utf-8") as f:
+            for (model, text_hash, intensity), cached in _PARAPHRASE_CACHE.items():
+                f.write(json.dumps({'model': model, 'hash': text_hash, 'intensity': intensity,
+                                    'text': cached}) + "\n")
+    except OSError as e:
+        print(f"⚠️ WARNING: Could not write paraphrase cache: {e}")
+
 
 # (Other worker classes like GeminiParaphraser and WorkerSignals are omitted for brevity - same as before)
 # Paste the WorkerSignals, GeminiParaphraser, and ParaphraseWorker classes here from the previous answer.
@@ -96,13 +251,19 @@ class GeminiParaphraser:
             print("⚠️ WARNING: Gemini API key not found. Paraphrasing is disabled.")
             return
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
+        self.model = genai.GenerativeModel(GEMINI_MODEL)
 
     def paraphrase(self, text, intensity, signals: WorkerSignals):
         if not self.model:
             signals.error.emit("Gemini model not initialized.")
             return text
 
+        key = _paraphrase_cache_key(text, intensity)
+        cached = _get_cached_paraphrase(key)
+        if cached is not None:
+            signals.status_update.emit("✅ Paraphrase cache hit.")
+            return cached
+
         prompt = f"""
         Please paraphrase the following text. Rewrite it to be unique while preserving the original meaning, tone, and key information.
         The desired intensity of the rewrite is '{intensity}'.
@@ -118,6 +279,7 @@ class GeminiParaphraser:
             signals.status_update.emit("🔄 Sending text to Gemini API...")
             response = self.model.generate_content(prompt)
             paraphrased_text = response.text.strip()
+            _store_paraphrase(key, paraphrased_text)
             signals.status_update.emit("✅ Paraphrasing complete.")
             return paraphrased_text
         except Exception as e:
@@ -125,6 +287,19 @@ class GeminiParaphraser:
             return text
 
 
+_paraphraser_singleton = None
+_paraphraser_lock = threading.Lock()
+
+
+def get_paraphraser():
+    """Returns the shared GeminiParaphraser, creating it on first use."""
+    global _paraphraser_singleton
+    with _paraphraser_lock:
+        if _paraphraser_singleton is None:
+            _paraphraser_singleton = GeminiParaphraser()
+        return _paraphraser_singleton
+
+
 # =============================================================================
 # REWRITTEN CORE TYPING ENGINE
 # =============================================================================
@@ -135,22 +310,30 @@ class TypingEngine:
         self.signals = signals
         self.keyboard = keyboard.Controller()
 
-        self.is_stopped = False
-        self.is_paused = False
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
         self.uncorrected_errors = []
 
+        # All engine randomness comes from one seeded generator; pass settings['seed'] to replay a run
+        self.seed = settings.get('seed')
+        if self.seed is None:
+            self.seed = random.randrange(2 ** 32)
+        self._rng = random.Random(self.seed)
+
         # Character-level delay simulation
         self.FAST_KEYS = set("eatisrondlcum")
         self.SLOW_KEYS = set("zjqxkvb")
 
     def stop(self):
-        self.is_stopped = True
+        self._stop_event.set()
+        self._resume_event.set()  # Release a paused sleep so it can see the stop
 
     def pause(self):
-        self.is_paused = True; self.signals.status_update.emit("⏸️ Paused.")
+        self._resume_event.clear(); self.signals.status_update.emit("⏸️ Paused.")
 
     def resume(self):
-        self.is_paused = False; self.signals.status_update.emit("▶️ Resuming...")
+        self._resume_event.set(); self.signals.status_update.emit("▶️ Resuming...")
 
     def _calculate_delays(self):
         # ... (This logic is mostly the same as before)
@@ -166,127 +349,208 @@ class TypingEngine:
         self.char_delay = (pure_typing_time_sec / total_chars) if total_chars > 0 else 0.05
         self.wpm_jitter = self.char_delay * 0.25  # Use a fixed jitter for simplicity
 
-        num_words = len(self.text_to_type.split())
-        num_sentences = self.text_to_type.count('.') + self.text_to_type.count('!') + self.text_to_type.count('?')
+        # Per-character base delays, indexed by code point (ASCII only)
+        self._delay_lut = array('d', [self.char_delay] * 128)
+        for char in self.FAST_KEYS: self._delay_lut[ord(char)] = self.char_delay * 0.8
+        for char in self.SLOW_KEYS: self._delay_lut[ord(char)] = self.char_delay * 1.3
+        # Jitter drawn once up front; wraps around if corrections type extra characters
+        uniform = self._rng.uniform
+        self._jitter_buf = [uniform(-self.wpm_jitter, self.wpm_jitter) for _ in range(total_chars + 1)]
+        self._next_jitter = cycle(self._jitter_buf).__next__
+        self._use_native_batch = send_input_batch is not None and self.char_delay < NATIVE_BATCH_MAX_CHAR_DELAY
+        self._build_typing_helpers()
+
+        # Count the pauses run() will actually take from the token list
+        self._tokens = self._tokenize(self.text_to_type)
+        num_words = num_sentences = num_newlines = 0
+        for _, kind in self._tokens:
+            if kind == TOKEN_WORD:
+                num_words += 1
+            elif kind == TOKEN_SENTENCE_END:
+                num_sentences += 1
+            else:
+                num_newlines += 1
         self.word_pause = (total_pause_time_sec * 0.20) / num_words if num_words > 0 else 0
         self.sentence_pause = (total_pause_time_sec * 0.40) / num_sentences if num_sentences > 0 else 0
-        self.paragraph_pause = (total_pause_time_sec * 0.40) / self.text_to_type.count('\n') if self.text_to_type.count(
-            '\n') > 0 else 0
+        self.paragraph_pause = (total_pause_time_sec * 0.40) / num_newlines if num_newlines > 0 else 0
+
+        self._sample_events()
+
+    def _sample_events(self):
+        """Rolls every per-token decision up front from the engine's seeded generator."""
+        rand = self._rng.random
+        n = len(self._tokens)
+        # Percent settings as probabilities, so each roll is a single random() compare
+        p_err = self.settings['error_rate'] / 100
+        p_correct = self.settings['correction_delay'] / 100
+        p_think = self.settings['thinking_chance'] / 100
+        p_afk = self.settings['afk_chance'] / 100
+        self._error_mask = [rand() < p_err for _ in range(n)]
+        self._correct_mask = [rand() < p_correct for _ in range(n)]
+        self._think_mask = [rand() < p_think for _ in range(n)]
+        self._afk_mask = [rand() < p_afk for _ in range(n)]
+        # Pause lengths for the tokens that pause (0.0 elsewhere), scaled from the same stream
+        lo, hi = self.settings['thinking_duration']
+        self._think_durations = [lo + (hi - lo) * rand() if hit else 0.0 for hit in self._think_mask]
+        lo, hi = self.settings['afk_duration']
+        self._afk_durations = [lo + (hi - lo) * rand() if hit else 0.0 for hit in self._afk_mask]
+
+    @staticmethod
+    def _tokenize(text):
+        tokens = []
+        for word in text.replace('\n', ' \n ').split(' '):
+            if word == '\n':
+                tokens.append((word, TOKEN_NEWLINE))
+            elif word.endswith(('.', '!', '?')):
+                tokens.append((word, TOKEN_SENTENCE_END))
+            else:
+                tokens.append((word, TOKEN_WORD))
+        return tokens
 
     def _get_mistake(self, word):
         # ... (Same as before, but ensure it's robust)
         if len(word) < 3 or not word.isalpha(): return word, None
-        mistake_type = random.choice(['adjacency', 'transposition', 'omission', 'insertion'])
+        mistake_type = self._rng.choice(_MISTAKE_TYPES)
 
-        idx = random.randint(0, len(word) - 1)
+        idx = self._rng.randint(0, len(word) - 1)
         if mistake_type == 'adjacency' and len(word) > 1:
-            char = word[idx]
-            adj_map = {'q': 'w', 'w': 'es', 'e': 'wr', 'r': 'et', 't': 'ry', 'y': 'tu', 'u': 'yi', 'i': 'uo', 'o': 'ip',
-                       'p': 'o[', 'a': 's', 's': 'adw', 'd': 'efs', 'f': 'dgr', 'g': 'fht', 'h': 'gjy', 'j': 'hku',
-                       'k': 'jli', 'l': 'k;o', ';': 'l', 'z': 'x', 'x': 'zc', 'c': 'xvd', 'v': 'cfb', 'b': 'vgn',
-                       'n': 'bhm', 'm': 'njk'}
-            if char.lower() in adj_map:
-                new_char = random.choice(adj_map[char.lower()])
+            char = word[idx].lower()
+            if char in _ADJ_KEYS:
+                new_char = self._rng.choice(_ADJ_MAP[char])
                 return word[:idx] + new_char + word[idx + 1:], word
         elif mistake_type == 'transposition' and len(word) > 1:
-            idx = random.randint(0, len(word) - 2)
+            idx = self._rng.randint(0, len(word) - 2)
             return word[:idx] + word[idx + 1] + word[idx] + word[idx + 2:], word
         elif mistake_type == 'omission':
             return word[:idx] + word[idx + 1:], word
         elif mistake_type == 'insertion':
-            return word[:idx] + random.choice('aeiou') + word[idx:], word
+            return word[:idx] + self._rng.choice(_INSERTION_CHARS) + word[idx:], word
         return word, None
 
     def _sleep(self, duration):
-        """A pausable, stoppable sleep."""
-        end_time = time.time() + duration
-        while time.time() < end_time:
-            if self.is_stopped: return
-            while self.is_paused:
-                time.sleep(0.1)
-                if self.is_stopped: return
-            time.sleep(0.1)
-
-    def _type_char(self, char):
-        self.keyboard.type(char)
-        delay = self.char_delay
-        if char in self.FAST_KEYS:
-            delay *= 0.8
-        elif char in self.SLOW_KEYS:
-            delay *= 1.3
-        self._sleep(max(0.02, delay + random.uniform(-self.wpm_jitter, self.wpm_jitter)))
+        """A pausable, stoppable sleep. Wakes immediately on stop; blocks while paused."""
+        if self._stop_event.wait(timeout=max(0, duration)): return
+        self._resume_event.wait()
+
+    def _build_typing_helpers(self):
+        """Builds _base_delay and _type_char as closures over the per-run typing state, so each keystroke reads locals."""
+        keyboard_type = self.keyboard.type
+        delay_lut = self._delay_lut
+        char_delay = self.char_delay
+        next_jitter = self._next_jitter
+        sleep = self._sleep
+
+        def base_delay(char):
+            code = ord(char)
+            return delay_lut[code] if code < 128 else char_delay
+
+        def type_char(char):
+            keyboard_type(char)
+            sleep(max(0.02, base_delay(char) + next_jitter()))
+
+        self._base_delay = base_delay
+        self._type_char = type_char
+
+    def _send_batch(self, s):
+        sent = send_input_batch(s) if self._use_native_batch else 0
+        if sent < len(s):
+            self.keyboard.type(s[sent:])  # Whatever SendInput did not inject goes through pynput
+
+    def _type_word(self, word):
+        """Types a correctly spelled word, sending runs of same-speed keys in one call when delays are short."""
+        if self.char_delay > BATCH_MAX_CHAR_DELAY:
+            type_char = self._type_char
+            for char in word: type_char(char)
+            return
+        for delay, group in groupby(word, key=self._base_delay):
+            run = ''.join(group)
+            self._send_batch(run)
+            n = len(run)
+            self._sleep(max(0.02 * n, n * delay + self._rng.gauss(0, self.wpm_jitter * math.sqrt(n))))
 
     def _perform_correction(self, incorrect, correct, current_pos, error_pos):
-        # Move cursor back
-        distance = current_pos - error_pos
-        for _ in range(distance): self.keyboard.press(keyboard.Key.left); self.keyboard.release(
-            keyboard.Key.left); self._sleep(0.02)
+        # Move cursor back to the end of the mistyped word
+        distance = current_pos - (error_pos + len(incorrect))
+        if distance > 0:
+            for _ in range(distance): self.keyboard.tap(keyboard.Key.left)
+            self._sleep(distance * 0.02)
 
         # Fix error
-        for _ in range(len(incorrect)): self.keyboard.press(keyboard.Key.backspace); self.keyboard.release(
-            keyboard.Key.backspace); self._sleep(0.05)
+        for _ in range(len(incorrect)): self.keyboard.tap(keyboard.Key.backspace); self._sleep(0.05)
         for char in correct: self._type_char(char)
 
-        # Move cursor forward
-        for _ in range(distance - len(correct)): self.keyboard.press(keyboard.Key.right); self.keyboard.release(
-            keyboard.Key.right); self._sleep(0.02)
+        # Move cursor forward to where typing left off
+        if distance > 0:
+            for _ in range(distance): self.keyboard.tap(keyboard.Key.right)
+            self._sleep(distance * 0.02)
 
     def run(self):
         self._calculate_delays()
         self.signals.status_update.emit("Starting in 5 seconds...")
         self._sleep(5)
-        self.signals.status_update.emit("🚀 Typing started!")
+        self.signals.status_update.emit(f"🚀 Typing started! (seed {self.seed})")
 
         current_pos = 0
-        words = self.text_to_type.replace('\n', ' \n ').split(' ')
+        tokens = self._tokens
+        num_tokens = len(tokens)
+        error_mask, correct_mask = self._error_mask, self._correct_mask
+        think_mask, afk_mask = self._think_mask, self._afk_mask
+        think_durations, afk_durations = self._think_durations, self._afk_durations
+        type_char = self._type_char
 
-        for i, word in enumerate(words):
-            if self.is_stopped: break
+        for i, (word, kind) in enumerate(tokens):
+            if self._stop_event.is_set(): break
 
             # --- PRE-WORD ACTIONS ---
             # 1. Delayed Correction Check
-            if self.uncorrected_errors and random.randint(1, 100) <= self.settings['correction_delay']:
+            if self.uncorrected_errors and correct_mask[i]:
                 error_to_fix = self.uncorrected_errors.pop(0)
                 self.signals.status_update.emit(f"🤔 Going back to fix '{error_to_fix['incorrect']}'...")
                 self._perform_correction(error_to_fix['incorrect'], error_to_fix['correct'], current_pos,
                                          error_to_fix['pos'])
+                # Everything after the fixed word shifts by the change in length
+                shift = len(error_to_fix['correct']) - len(error_to_fix['incorrect'])
+                current_pos += shift
+                for pending in self.uncorrected_errors: pending['pos'] += shift
                 self.signals.status_update.emit("✅ Fixed.")
 
             # 2. Thinking Pause Check
-            if random.randint(1, 100) <= self.settings['thinking_chance']:
-                duration = random.uniform(*self.settings['thinking_duration'])
+            if think_mask[i]:
+                duration = think_durations[i]
                 self.signals.status_update.emit(f"🧠 Thinking for {duration:.1f}s...")
                 self._sleep(duration)
 
             # --- TYPING THE WORD ---
-            if word.isalpha() and random.random() < (self.settings['error_rate'] / 100):
+            typed = word
+            if error_mask[i] and word.isalpha():
                 incorrect, correct = self._get_mistake(word)
                 if correct:
                     # Log error for delayed correction
                     self.uncorrected_errors.append({'incorrect': incorrect, 'correct': correct, 'pos': current_pos})
-                    for char in incorrect: self._type_char(char)
+                    for char in incorrect: type_char(char)
+                    typed = incorrect
                 else:
-                    for char in word: self._type_char(char)
+                    self._type_word(word)
             else:
-                for char in word: self._type_char(char)
+                self._type_word(word)
 
-            current_pos += len(word) + 1
+            current_pos += len(typed)
 
             # --- POST-WORD ACTIONS ---
-            self.signals.progress.emit(int((i / len(words)) * 100))
-            if word == '\n':
-                if random.randint(1, 100) <= self.settings['afk_chance']:
-                    duration = random.uniform(*self.settings['afk_duration'])
+            self.signals.progress.emit(int((i / num_tokens) * 100))
+            if kind == TOKEN_NEWLINE:
+                if afk_mask[i]:
+                    duration = afk_durations[i]
                     self.signals.status_update.emit(f"☕ AFK break for {duration:.1f}s...")
                     self._sleep(duration)
                 else:
                     self._sleep(self.paragraph_pause)
-            elif word.endswith(('.', '!', '?')):
+            elif kind == TOKEN_SENTENCE_END:
                 self._sleep(self.sentence_pause)
             else:
-                self._type_char(' '); self._sleep(self.word_pause)
+                type_char(' '); current_pos += 1; self._sleep(self.word_pause)
 
-        if not self.is_stopped:
+        if not self._stop_event.is_set():
             self.signals.status_update.emit("🎉 Typing finished successfully!")
             self.signals.progress.emit(100)
         else:
@@ -307,7 +571,7 @@ class ParaphraseWorker(QObject):
     @Slot()
     def run(self):
         try:
-            paraphraser = GeminiParaphraser()
+            paraphraser = get_paraphraser()
             if not paraphraser.model:
                 self.signals.error.emit("Gemini not initialized (check API key).")
                 self.signals.finished.emit()
@@ -343,39 +607,38 @@ class GlobalHotkeyListener(threading.Thread):
     def __init__(self, main_window):
         super().__init__(daemon=True)
         self.main_window = main_window
-        self.hotkey_start_stop = keyboard.HotKey(keyboard.HotKey.parse('<ctrl>+<alt>+s'), self.on_start_stop)
-        self.hotkey_pause_resume = keyboard.HotKey(keyboard.HotKey.parse('<ctrl>+<alt>+p'), self.on_pause_resume)
+        self.hotkeys = {
+            '<ctrl>+<alt>+s': self.on_start_stop,
+            '<ctrl>+<alt>+p': self.on_pause_resume,
+        }
+        self.listener = None
 
     def on_start_stop(self):
-        # Safely trigger button clicks from this thread
-        if self.main_window.worker:
-            self.main_window.stop_button.click()
-        else:
-            self.main_window.start_button.click()
+        # Runs on the pynput thread: hand off to the GUI thread via a queued signal
+        self.main_window.hotkey_start_stop_triggered.emit()
 
     def on_pause_resume(self):
-        if self.main_window.worker:
-            self.main_window.start_button.click()
+        self.main_window.hotkey_pause_resume_triggered.emit()
 
     def run(self):
-        with keyboard.Listener(
-                on_press=self.for_canonical(self.hotkey_start_stop.press),
-                on_release=self.for_canonical(self.hotkey_start_stop.release)
-        ) as l, keyboard.Listener(
-            on_press=self.for_canonical(self.hotkey_pause_resume.press),
-            on_release=self.for_canonical(self.hotkey_pause_resume.release)
-        ) as p:
-            l.join()
-            p.join()
+        # A single OS keyboard hook dispatches every registered chord
+        self.listener = keyboard.GlobalHotKeys(self.hotkeys)
+        with self.listener:
+            self.listener.join()
 
-    def for_canonical(self, f):
-        return lambda k: f(self.main_window.hotkey_listener.canonical(k))
+    def stop(self):
+        """Removes the OS keyboard hook; run() returns once the listener exits."""
+        if self.listener:
+            self.listener.stop()
 
 
 # =============================================================================
 # MAIN WINDOW (GUI)
 # =============================================================================
 class MainWindow(QMainWindow):
+    hotkey_start_stop_triggered = Signal()
+    hotkey_pause_resume_triggered = Signal()
+
     def __init__(self):
         super().__init__()
         # ... (Same __init__ content as before)
@@ -387,6 +650,13 @@ class MainWindow(QMainWindow):
         self.worker = None
         self.is_paused_state = False
 
+        # Log lines are batched and flushed to the console at most every 100 ms
+        self._log_buffer: list[str] = []
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
         self._setup_ui()
         self._connect_signals()
         self.hotkey_listener = GlobalHotkeyListener(self)
@@ -408,6 +678,7 @@ class MainWindow(QMainWindow):
         right_widget = QWidget()
         right_widget.setLayout(right_layout)
         right_widget.setFixedWidth(400)
+        self._toggleable_groups: list[QGroupBox] = []
 
         # Title and Top Controls
         title_label = QLabel("Ghostwriter Controls");
@@ -441,6 +712,7 @@ class MainWindow(QMainWindow):
 
         # Typing Cadence Group
         cadence_group = QGroupBox("Typing Cadence")
+        self._toggleable_groups.append(cadence_group)
         cadence_layout = QVBoxLayout(cadence_group)
         self.duration_spinbox = self._create_slider_spinbox(cadence_layout, "Total Duration (min)", 1, 1440, 20,
                                                             is_spinbox=True)
@@ -451,6 +723,7 @@ class MainWindow(QMainWindow):
 
         # Error & Correction Group
         error_group = QGroupBox("Error & Correction")
+        self._toggleable_groups.append(error_group)
         error_layout = QVBoxLayout(error_group)
         self.error_slider = self._create_slider_spinbox(error_layout, "Typo Rate %", 0, 20, 4)
         self.correction_delay_slider = self._create_slider_spinbox(error_layout, "Correction Delay %", 0, 100, 50)
@@ -458,6 +731,7 @@ class MainWindow(QMainWindow):
 
         # AI Paraphrasing Group
         ai_group = QGroupBox("AI Paraphrasing (Gemini)")
+        self._toggleable_groups.append(ai_group)
         ai_layout = QVBoxLayout(ai_group)
         self.paraphrase_button = QPushButton("✨ Rewrite Text with AI")
         ai_layout.addWidget(self.paraphrase_button)
@@ -473,6 +747,7 @@ class MainWindow(QMainWindow):
         right_layout.addWidget(QLabel("<b>Log Console:</b>"))
         self.log_console = QTextEdit();
         self.log_console.setReadOnly(True)
+        self.log_console.document().setMaximumBlockCount(1000)
         right_layout.addWidget(self.log_console)
 
         main_layout.addLayout(left_layout, 2)
@@ -483,20 +758,22 @@ class MainWindow(QMainWindow):
     def _create_slider_spinbox(self, layout, label, min_val, max_val, default_val, is_spinbox=False):
         h_layout = QHBoxLayout()
         h_layout.addWidget(QLabel(label))
-        widget_label = QLabel(str(default_val))
         if is_spinbox:
+            # A spinbox already displays its own value, so no companion label
             widget = QSpinBox()
             widget.setRange(min_val, max_val)
             widget.setValue(default_val)
-            widget.valueChanged.connect(lambda v: widget_label.setText(str(v)))  # This is just for show if needed
+            h_layout.addWidget(widget)
         else:
             widget = QSlider(QtCore.Qt.Horizontal)
             widget.setRange(min_val, max_val)
             widget.setValue(default_val)
+            widget.setTracking(False)  # Emit valueChanged on release, not on every drag step
+            widget_label = QLabel(str(default_val))
             widget.valueChanged.connect(lambda v: widget_label.setText(str(v)))
+            h_layout.addWidget(widget)
+            h_layout.addWidget(widget_label)
 
-        h_layout.addWidget(widget)
-        h_layout.addWidget(widget_label)
         layout.addLayout(h_layout)
         return widget
 
@@ -518,10 +795,22 @@ class MainWindow(QMainWindow):
         self.start_button.clicked.connect(self.handle_start_resume)
         self.stop_button.clicked.connect(self.stop_all_processes)
         self.paraphrase_button.clicked.connect(self.start_paraphrasing)
+        self.hotkey_start_stop_triggered.connect(self.on_hotkey_start_stop, QtCore.Qt.QueuedConnection)
+        self.hotkey_pause_resume_triggered.connect(self.on_hotkey_pause_resume, QtCore.Qt.QueuedConnection)
 
     def set_always_on_top(self, checked):
-        # This requires window recreation or flag setting.
-        # The easy way:
+        # Fast path: toggle the flag on the native window without re-creating it
+        # (on X11 the platform plugin turns this into a _NET_WM_STATE_ABOVE update).
+        # overrideWindowFlags keeps the widget's own flags in sync without touching the window.
+        wh = self.windowHandle()
+        if wh is not None:
+            flags = self.windowFlags()
+            flags = flags | QtCore.Qt.WindowStaysOnTopHint if checked else flags & ~QtCore.Qt.WindowStaysOnTopHint
+            self.overrideWindowFlags(flags)
+            wh.setFlag(QtCore.Qt.WindowStaysOnTopHint, checked)
+            return
+
+        # Fallback for when no native window exists yet: this requires window recreation
         if checked:
             self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
         else:
@@ -549,6 +838,7 @@ class MainWindow(QMainWindow):
         self._set_controls_enabled(False)
         self.start_button.setText("⏸️ Pause")
         self.is_paused_state = False
+        self._log_buffer.clear()
         self.log_console.clear()
         self.progress_bar.setValue(0)
         self.log_message("🚀 Starting Typing Process...")
@@ -569,18 +859,27 @@ class MainWindow(QMainWindow):
     # Paste the full MainWindow methods here from the previous answer, they should work with minor/no changes
     def _set_controls_enabled(self, enabled):
         """Enable or disable UI controls to prevent changes during operation."""
+        self.setUpdatesEnabled(False)  # Repaint once after all toggles
         self.source_text_edit.setEnabled(enabled)
         self.paraphrase_button.setEnabled(enabled)
         self.profile_combo.setEnabled(enabled)
-        for group_box in self.findChildren(QGroupBox):
+        for group_box in self._toggleable_groups:
             group_box.setEnabled(enabled)
+        self.setUpdatesEnabled(True)
 
         if enabled:
             self.start_button.setText("▶️ Start / Resume")
             self.is_paused_state = False
 
     def log_message(self, message):
-        self.log_console.append(message)
+        if not self._log_buffer:
+            self._log_flush_timer.start()
+        self._log_buffer.append(message)
+
+    def _flush_log(self):
+        if self._log_buffer:
+            self.log_console.append('\n'.join(self._log_buffer))
+            self._log_buffer.clear()
 
     def update_progress(self, value):
         self.progress_bar.setValue(value)
@@ -642,8 +941,21 @@ class MainWindow(QMainWindow):
             self.worker.engine.stop()
             self.log_message("🛑 Sending stop signal...")
 
+    @Slot()
+    def on_hotkey_start_stop(self):
+        if self.worker:
+            self.stop_all_processes()
+        else:
+            self.handle_start_resume()
+
+    @Slot()
+    def on_hotkey_pause_resume(self):
+        if self.worker:
+            self.handle_start_resume()
+
     def closeEvent(self, event):
         self.stop_all_processes()
+        self.hotkey_listener.stop()
         if self.thread:
             self.thread.quit()
             self.thread.wait(5000)